@@ -1,47 +1,28 @@
 import os
+import time
 import logging
 import math
 import json
-from PySide6.QtCore import QObject, Slot, QUrl, Signal
+from PySide6.QtCore import QObject, Slot, QUrl, QTimer
 from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox
 from PySide6.QtWebChannel import QWebChannel
 
 from main_window import MainWindow
 from local_http_server import LocalHttpServer
-from selection_model import SelectionModel
-from download_worker import DownloadWorker, format_tile_s3_key
+from map_bridge import MapBridge
+from selection_model import SelectionModel, decode_tile
+from download_worker import (
+    DownloadWorker,
+    format_tile_name,
+    format_tile_s3_key,
+    list_existing_files,
+    get_s3_client,
+    get_download_executor,
+)
 from about_dialog import AboutDialog
 
 logger = logging.getLogger(__name__)
 
-# --- Define the Bridge class ---
-class MapBridge(QObject):
-    """
-    A bridge object to facilitate communication from JavaScript to Python.
-    It exposes 'slots' that can be called from JS and emits 'signals'
-    that the main application can connect to.
-    """
-    coordinates_changed = Signal(float, float, int)
-    tile_clicked = Signal(int, int)
-
-    @Slot(float, float, int)
-    def on_mouse_move(self, lat, lng, zoom):
-        """
-        A slot that is called from JavaScript whenever the mouse moves over the map.
-        
-        Args:
-            lat (float): Latitude of the mouse cursor.
-            lng (float): Longitude of the mouse cursor.
-            zoom (int): The current zoom level of the map.
-        """
-        self.coordinates_changed.emit(lat, lng, zoom)
-        
-    # --- Slot that receives the raw tile click from JS ---
-    @Slot(int, int)
-    def on_tile_clicked(self, lat, lon):
-        self.tile_clicked.emit(lat, lon) 
-
-
 # --- Controller class ---
 class AppController(QObject):
     """
@@ -52,18 +33,49 @@ class AppController(QObject):
     - Starts and stops background services (like the HTTP server).
     - Connects signals from the View to its slots (application logic).
     """
+    # Above this many tiles changed at once, the map's highlights are
+    # replaced wholesale rather than updated tile by tile
+    HIGHLIGHT_SYNC_THRESHOLD = 256
+
     def __init__(self, base_dir):
         super().__init__()
         self.base_dir = base_dir
         self.worker = None
+        self._stopping_worker = None
+        self.http_server = None
 
         # The controller creates and owns both the Model and the View.
         self.model = SelectionModel()
         self.view = MainWindow(self.base_dir)
 
-        # Start the background services
-        self._start_http_server()
+        # Sidebar refreshes are coalesced: a burst of selection changes
+        # (e.g. clicking across many tiles) results in a single redraw.
+        self._selection_dirty = False
+        self._selection_ui_timer = QTimer(self)
+        self._selection_ui_timer.setSingleShot(True)
+        self._selection_ui_timer.setInterval(16)
+        self._selection_ui_timer.timeout.connect(self._flush_selection_ui)
+
+        # Map highlight changes are buffered and sent to JavaScript in one call.
+        # Keyed by tile, so a tile clicked several times within one flush is
+        # sent once, with its last action.
+        self._pending_highlights = {}
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.setInterval(16)
+        self._highlight_timer.timeout.connect(self._flush_highlights)
+
+        # While downloading, the status bar is refreshed once per second from
+        # the worker's counters rather than by a signal for every file.
+        self._download_started_at = 0.0
+        self._download_status_timer = QTimer(self)
+        self._download_status_timer.setInterval(1000)
+        self._download_status_timer.timeout.connect(self._update_download_status)
+
+        # Start the background services. The HTTP server, and with it the
+        # map page load, is started from show() once the window is up.
         self._setup_web_channel()
+        self._warm_up_s3_client()
 
         # Connect signals from the view to the controller's logic slots
         self._connect_signals()
@@ -76,6 +88,15 @@ class AppController(QObject):
         self.http_server.start()
         logger.debug("Local HTTP server thread started.")
 
+    def _warm_up_s3_client(self):
+        """
+        Imports boto3 and builds the shared S3 client in the background, so
+        that neither the startup nor the first download pays for it. The same
+        client, and its connection pool, is then used by every download for
+        the rest of the session.
+        """
+        get_download_executor().submit(get_s3_client)
+
     def _setup_web_channel(self):
         """Initializes the QWebChannel to enable JS-to-Python communication."""
         self.channel = QWebChannel()
@@ -99,11 +120,17 @@ class AppController(QObject):
         self.bridge.tile_clicked.connect(self.on_tile_selected)
 
         self.model.selection_changed.connect(self.on_selection_changed)
+        self.model.selection_delta.connect(self.on_selection_delta)
         
 
     def show(self):
-        """Tells the view to show itself."""
+        """
+        Tells the view to show itself. The map server is only started once the
+        event loop runs, so the window paints before WebEngine starts loading
+        the page.
+        """
         self.view.showMaximized()
+        QTimer.singleShot(0, self._start_http_server)
 
     @Slot(str, int)
     def on_server_ready(self, host, port):
@@ -119,7 +146,7 @@ class AppController(QObject):
     @Slot(bool)
     def on_toggle_grid(self, is_checked):
         """
-        Executes JavaScript in the web view to show or hide the grid.
+        Tells the map, over the web channel, to show or hide the grid.
         
         Args:
             is_checked (bool): The new state of the action, passed by the 'toggled' signal.
@@ -129,27 +156,15 @@ class AppController(QObject):
             return
 
         logger.debug(f"Toggling grid visibility to: {is_checked}")
-                
-        js_code = f"toggleGridVisibility({str(is_checked).lower()});"
-        self.view.run_javascript(js_code)    
+        self.bridge.grid_visibility_changed.emit(is_checked)
 
     @Slot()
     def on_clear_selection(self):
         """Clears the current selection in both the model and the view."""
         logger.debug("Clearing all selected tiles from model and view.")
         
-        # Clear the model's selection
+        # Clear the model's selection; the map and the sidebar follow its signals
         self.model.clear_selection()
-        
-        # Command the view to remove all highlights
-        if self.view.is_map_ready():
-            self.view.run_javascript("clearAllHighlights();")
-        else:
-            logger.info("Map is not ready for JS commands yet; cannot clear highlights.")
-        
-        # Update the sidebar list and button state
-        #self.view.update_tile_list([])
-        #self.view.update_download_button_state(False)
 
 
     @Slot(float, float, int)
@@ -166,31 +181,69 @@ class AppController(QObject):
     @Slot(int, int)
     def on_tile_selected(self, lat, lon):
         """
-        Handles the direct click event from the map. This is the primary handler
-        for updating the map's visual state and the data model.
+        Handles the direct click event from the map by toggling the tile in
+        the data model. The map's highlight follows from the model's delta.
         """
         tile = (lat, lon)
         logger.debug(f"Tile click received for ({lat}, {lon}).")
-        
-        if tile in self.model.get_selected_tiles():
-            self.view.run_javascript(f"removeHighlight({lat}, {lon});")
-        else:
-            self.view.run_javascript(f"addHighlight({lat}, {lon});")
-        
-        # After commanding the view, update the model.
         self.model.toggle_selection(tile)
+
+    @Slot(frozenset, frozenset)
+    def on_selection_delta(self, added, removed):
+        """
+        Queues the map highlight changes for what the model just added and
+        removed (as packed tile keys). A large change (clearing, importing)
+        replaces all the highlights at once instead, and drops the now stale
+        queued changes.
+        """
+        if len(added) + len(removed) > self.HIGHLIGHT_SYNC_THRESHOLD:
+            self._pending_highlights.clear()
+            self.bridge.highlights_synced.emit([list(tile) for tile in self.model.snapshot()])
+            return
+
+        for key in added:
+            self._pending_highlights[key] = 'add'
+        for key in removed:
+            self._pending_highlights[key] = 'remove'
+        if not self._highlight_timer.isActive():
+            self._highlight_timer.start()
+
+    @Slot()
+    def _flush_highlights(self):
+        """Sends all the buffered highlight changes to the map in a single message."""
+        if not self._pending_highlights:
+            return
+        ops = [[*decode_tile(key), action] for key, action in self._pending_highlights.items()]
+        self._pending_highlights = {}
+        self.bridge.highlights_changed.emit(ops)
     
-    @Slot(set)
+    @Slot(frozenset)
     def on_selection_changed(self, selected_tiles):
         """
-        Handles updates when the data model changes. This should only update
-        UI elements that depend on the entire list, like the sidebar.
+        Handles updates when the data model changes. The sidebar is not
+        redrawn here; the refresh is scheduled so that several changes in
+        quick succession are rendered only once.
         """
-        logging.debug(f"Model selection changed. New selection: {selected_tiles}")
+        logging.debug(f"Model selection changed. {len(selected_tiles)} tiles selected.")
 
-        tile_names = [self.format_tile_name(*tile) for tile in sorted(list(selected_tiles))]
+        self._selection_dirty = True
+        if not self._selection_ui_timer.isActive():
+            self._selection_ui_timer.start()
+
+    @Slot()
+    def _flush_selection_ui(self):
+        """
+        Updates the UI elements that depend on the entire selection,
+        like the sidebar list, the tile count and the download button.
+        """
+        if not self._selection_dirty:
+            return
+        self._selection_dirty = False
+
+        selected_tiles = self.model.snapshot()
+        tile_names = [self.format_tile_name(*tile) for tile in selected_tiles]
         self.view.update_tile_list(tile_names)
-        self.view.update_download_button_state(self.model.has_selection())
+        self.view.update_download_button_state(bool(selected_tiles))
         self.view.update_tile_count(len(selected_tiles))
 
 
@@ -203,6 +256,9 @@ class AppController(QObject):
         if self.worker is not None and self.worker.isRunning():
             logging.info("Download already in progress.")
             return
+
+        # Take a single snapshot of the selection for the whole download
+        selected_tiles = self.model.snapshot()
         
         # 1. Ask user for a save directory
         save_path = QFileDialog.getExistingDirectory(self.view, "Select Save Directory", os.path.expanduser("~"))
@@ -210,7 +266,8 @@ class AppController(QObject):
             return # User cancelled
 
         # 2. Ask user how to handle existing files
-        overwrite_mode = self._handle_existing_files(save_path)
+        existing_on_disk = list_existing_files(save_path)
+        overwrite_mode = self._handle_existing_files(selected_tiles, existing_on_disk)
         if overwrite_mode is None:
             return # User cancelled
 
@@ -218,27 +275,53 @@ class AppController(QObject):
         self.view.set_download_state(is_downloading=True)
         
         # 4. Create, configure, and start the worker
-        self.worker = DownloadWorker(list(self.model.get_selected_tiles()), save_path, overwrite_mode)
-        logging.info(f"Starting download worker with {len(self.model.get_selected_tiles())} tiles to process.")
+        self.worker = DownloadWorker(selected_tiles, save_path, overwrite_mode, existing_files=existing_on_disk)
+        logging.info(f"Starting download worker with {len(selected_tiles)} tiles to process.")
         
         # 5. Connect signals from the worker to the controller's slots (or directly to the view)
-        self.worker.file_progress.connect(lambda cur, tot: self.view.show_status_message(f"Processing file {cur} of {tot}...", 0))
-        self.worker.total_progress_updated.connect(self.view.progress_bar.setValue)
-        self.worker.total_progress_updated.connect(lambda _, tot: self.view.progress_bar.setMaximum(tot))
+        self.worker.total_progress_updated.connect(self.on_download_progress)
         self.worker.status_update.connect(self.view.show_status_message)
         self.worker.error_occurred.connect(lambda msg: self.view.show_status_message(f"ERROR: {msg}", 10000))
         self.worker.finished.connect(self.on_download_finished)
         
+        self.view.show_status_message("Starting download...", 0)
+        self._download_started_at = time.monotonic()
+        self._download_status_timer.start()
         self.worker.start()
 
+    @Slot()
+    def _update_download_status(self):
+        """Shows the number of finished tiles and the average transfer rate."""
+        if self.worker is None:
+            return
+        downloaded, total, bytes_downloaded, not_found = self.worker.progress_snapshot()
+        elapsed = max(time.monotonic() - self._download_started_at, 1e-6)
+        rate = bytes_downloaded / elapsed / (1024 * 1024)
+        message = f"Downloaded {downloaded} / {total} tiles, {rate:.1f} MB/s"
+        if not_found:
+            message += f" ({not_found} not found)"
+        self.view.show_status_message(message, 0)
+
+
+    @Slot("qint64", "qint64")
+    def on_download_progress(self, bytes_downloaded, total_bytes):
+        """
+        Updates the progress bar. The total grows while tile sizes are still
+        being looked up, so it is never allowed to fall below the bytes
+        already downloaded.
+        """
+        self.view.set_progress(bytes_downloaded, max(total_bytes, bytes_downloaded))
 
-    def _handle_existing_files(self, save_path):
-        """Checks for existing files and asks the user how to proceed via a dialog."""
-        existing_files = [
-            os.path.basename(format_tile_s3_key(*tile)) 
-            for tile in self.model.get_selected_tiles()
-            if os.path.exists(os.path.join(save_path, os.path.basename(format_tile_s3_key(*tile))))
-        ]
+    def _handle_existing_files(self, tiles, existing_on_disk):
+        """
+        Checks for existing files and asks the user how to proceed via a dialog.
+
+        Args:
+            tiles (tuple): The (lat, lon) tuples about to be downloaded.
+            existing_on_disk (set): The file names already in the save directory.
+        """
+        file_names = [os.path.basename(format_tile_s3_key(*tile)) for tile in tiles]
+        existing_files = [name for name in file_names if name in existing_on_disk]
         
         if not existing_files:
             return 'overwrite' # No conflicts, proceed normally
@@ -284,9 +367,12 @@ class AppController(QObject):
             return
 
         self.worker.finished.disconnect(self.on_download_finished)
+        self._download_status_timer.stop()
 
-        was_cancelled = self.worker._is_stopped
+        was_cancelled = self.worker.is_stopped()
         logging.debug(f"Download worker finished. Cancelled: {was_cancelled}")
+        _, total, _, _ = self.worker.progress_snapshot()
+        not_found = self.worker.not_found_tiles()
         
         # Command the view to return to its idle state
         self.view.set_download_state(is_downloading=False)
@@ -295,6 +381,9 @@ class AppController(QObject):
 
         if was_cancelled:
             msg = "Download cancelled."            
+        elif not_found:
+            msg = f"Downloads completed, {len(not_found)} of {total} tiles not found."
+            self._show_not_found_tiles(not_found, total)
         else:
             msg = "All downloads completed!"
             QMessageBox.information(self.view, "Download Complete", "All selected tiles have been processed.")
@@ -302,20 +391,56 @@ class AppController(QObject):
         self.view.show_status_message(msg, 10000)
 
 
+    def _show_not_found_tiles(self, not_found, total):
+        """
+        Tells the user which tiles the server had no data for.
+
+        Args:
+            not_found (list): The file names of the tiles not found.
+            total (int): The number of tiles in the download.
+        """
+        msg_box = QMessageBox(self.view)
+        msg_box.setWindowTitle("Download Complete")
+        msg_box.setIcon(QMessageBox.Warning)
+        msg_box.setText(f"{len(not_found)} of the {total} tiles were not found on the server.")
+        msg_box.setInformativeText("Copernicus DEM has no tiles for areas like the open ocean.")
+        msg_box.setDetailedText("\n".join(not_found))
+        msg_box.exec()
+
+
     @Slot()
     def cleanup(self):
-        """Ensures background threads are stopped when the app closes."""
+        """
+        Ensures background threads are stopped when the app closes.
+        A running download is not waited for on the GUI thread: the worker is
+        asked to stop and the application quits once it reports it has finished.
+        """
         logger.info("Cleaning up background services...")
 
         if self.worker and self.worker.isRunning():
+            # Keep the event loop alive after the window has closed, until
+            # the worker has wound down.
+            QApplication.instance().setQuitOnLastWindowClosed(False)
+            self._stopping_worker = self.worker
+            self.worker.finished.connect(self._final_quit)
             self.worker.stop()
-            self.worker.wait()
-        self.http_server.stop()
-        self.http_server.wait()
-        
-        from PySide6.QtWidgets import QApplication
+            return
+
+        self._final_quit()
+
+    @Slot()
+    def _final_quit(self):
+        """Stops the remaining background services and quits the application."""
+        if self._stopping_worker is not None:
+            # run() has already returned at this point, so this is immediate
+            self._stopping_worker.wait()
+
+        if self.http_server is not None:
+            self.http_server.stop()
+            self.http_server.wait()
+
         QApplication.instance().quit()
-        
+
 
     @Slot()
     def show_about_dialog(self):
@@ -380,12 +505,8 @@ class AppController(QObject):
             # Convert the list of lists back to a set of tuples
             new_selection = {tuple(item) for item in selection_list}
 
-            # Command the Model to update its state
+            # Command the Model to update its state; the map follows its signals
             self.model.set_selection(new_selection)
-
-            # Command the View to perform a full sync of map highlights
-            js_arg = json.dumps([list(tile) for tile in new_selection])
-            self.view.run_javascript(f"syncHighlights({js_arg});")
             
             self.view.show_status_message(f"Imported {len(new_selection)} tiles from {os.path.basename(file_path)}")
             logger.info(f"Imported selection from {file_path}")
@@ -398,6 +519,4 @@ class AppController(QObject):
     # --- Helper method for the controller ---
     def format_tile_name(self, lat, lon):
         """Formats lat/lon coordinates into the user-friendly tile name."""
-        lat_str = f"N{abs(lat):02d}" if lat >= 0 else f"S{abs(lat):02d}"
-        lon_str = f"E{abs(lon):03d}" if lon >= 0 else f"W{abs(lon):03d}"
-        return f"Copernicus_DSM_COG_10_{lat_str}_00_{lon_str}_00_DEM"    
\ No newline at end of file
+        return format_tile_name(lat, lon)
@@ -9,6 +9,11 @@ from app_controller import AppController
 if __name__ == "__main__":
 
     setup_logging(debug=True)
+
+    # Chromium features the embedded map never uses. Must be set before
+    # QtWebEngine starts; flags already set by the user are kept.
+    chromium_flags = os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "")
+    os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = f"{chromium_flags} --disable-features=Translate,MediaRouter".strip()
     
     app = QApplication(sys.argv)
     base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -59,16 +59,18 @@ def calcola_e_gestisci_tile_copernicus(min_lon, min_lat, max_lon, max_lat, carte
     lon_end = math.ceil(max_lon)
     lat_end = math.ceil(max_lat)
 
+    # Format each latitude row and longitude column label only once,
+    # instead of re-formatting both for every cell of the grid
+    lat_strs = [f"N{abs(lat):02d}" if lat >= 0 else f"S{abs(lat):02d}" for lat in range(lat_start, lat_end)]
+    lon_strs = [f"E{abs(lon):03d}" if lon >= 0 else f"W{abs(lon):03d}" for lon in range(lon_start, lon_end)]
+
     # Generate the list of tile keys to process
-    tiles_to_process = []
-    for lat in range(lat_start, lat_end):
-        for lon in range(lon_start, lon_end):
-            lat_str = f"N{abs(lat):02d}" if lat >= 0 else f"S{abs(lat):02d}"
-            lon_str = f"E{abs(lon):03d}" if lon >= 0 else f"W{abs(lon):03d}"
-            
-            nome_base_tile = f"Copernicus_DSM_COG_10_{lat_str}_00_{lon_str}_00_DEM"
-            s3_key = f"{nome_base_tile}/{nome_base_tile}.tif"
-            tiles_to_process.append(s3_key)
+    nomi_base_tile = [
+        f"Copernicus_DSM_COG_10_{lat_str}_00_{lon_str}_00_DEM"
+        for lat_str in lat_strs
+        for lon_str in lon_strs
+    ]
+    tiles_to_process = [f"{nome_base_tile}/{nome_base_tile}.tif" for nome_base_tile in nomi_base_tile]
 
     if not tiles_to_process:
         print("No tiles found for the specified coordinates.")
@@ -1,137 +1,580 @@
 import os
+import shutil
 import logging
-import boto3
-import botocore
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait
 from PySide6.QtCore import QThread, Signal
 
 logger = logging.getLogger(__name__)
 
-# Helper function to format tile names (moved here for encapsulation)
-def format_tile_s3_key(lat, lon):
-    """Formats lat/lon into the full S3 key for a tile."""
+__all__ = [
+    "DownloadWorker",
+    "DownloadCancelled",
+    "S3_BUCKET",
+    "format_tile_name",
+    "format_tile_s3_key",
+    "list_existing_files",
+    "get_s3_client",
+    "get_download_executor",
+    "get_part_executor",
+]
+
+# Public AWS Open Data bucket holding the Copernicus GLO-30 DEM
+S3_BUCKET = "copernicus-dem-30m"
+
+# Number of tiles downloaded concurrently. S3 throughput per connection is
+# latency-bound, so several parallel streams make much better use of the link.
+MAX_WORKERS = 8
+
+# Tiles larger than PART_SIZE are fetched as several byte-range requests in
+# parallel, since a single S3 connection is capped well below a fast link.
+PART_SIZE = 16 * 1024 * 1024
+MAX_PART_WORKERS = 8
+
+# Extra attempts for a GET that fails to connect or times out, on top of
+# botocore's own retries, with an exponential backoff starting at this delay.
+GET_RETRIES = 3
+GET_RETRY_BASE_DELAY = 0.5
+
+# HTTP connections kept by the shared S3 client. Sized from the worker counts
+# so that concurrent requests never have to wait for a free connection.
+MAX_POOL_CONNECTIONS = MAX_WORKERS * 4
+
+# Socket timeouts in seconds. botocore's default of 60s for each leaves a
+# stalled connection hanging for a minute before the retries kick in.
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+
+# Interval between two progress signals (10 Hz): smooth enough for a progress
+# bar, while emitting once per chunk would flood the GUI thread with queued
+# signals and repaints. The final state is always emitted when the batch ends.
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Size of the reads from S3. Files are opened with the default (small) buffer:
+# writes larger than the buffer go straight to the OS without an extra copy.
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Latitude/longitude labels ("S90" ... "N90", "W180" ... "E180"), formatted
+# once at import time and indexed by lat + 90 / lon + 180.
+_LAT_STRS = tuple(f"N{lat:02d}" if lat >= 0 else f"S{-lat:02d}" for lat in range(-90, 91))
+_LON_STRS = tuple(f"E{lon:03d}" if lon >= 0 else f"W{-lon:03d}" for lon in range(-180, 181))
+
+# The template's bound __mod__: a single C-level printf-style substitution
+_format_tile_name = "Copernicus_DSM_COG_10_%s_00_%s_00_DEM".__mod__
+
+def _tile_label_strs(lat, lon):
+    """Returns the latitude and longitude labels used in a tile's name."""
+    if -90 <= lat <= 90 and -180 <= lon <= 180:
+        return _LAT_STRS[lat + 90], _LON_STRS[lon + 180]
+    # Outside the table (e.g. the map has been panned past the antimeridian)
     lat_str = f"N{abs(lat):02d}" if lat >= 0 else f"S{abs(lat):02d}"
     lon_str = f"E{abs(lon):03d}" if lon >= 0 else f"W{abs(lon):03d}"
-    base_name = f"Copernicus_DSM_COG_10_{lat_str}_00_{lon_str}_00_DEM"
-    return f"{base_name}/{base_name}.tif"
+    return lat_str, lon_str
+
+@functools.lru_cache(maxsize=65536)
+def format_tile_name(lat, lon):
+    """
+    Formats lat/lon coordinates into the user-friendly tile name.
+    Memoized like format_tile_s3_key: the status bar asks for the name of the
+    tile under the mouse on every move, and the sidebar for every selected tile.
+    """
+    return _format_tile_name(_tile_label_strs(lat, lon))
+
+# Helper function to format tile names (moved here for encapsulation)
+@functools.lru_cache(maxsize=65536)
+def format_tile_s3_key(lat, lon):
+    """
+    Formats lat/lon into the full S3 key for a tile.
+    The result only depends on (lat, lon), so it is memoized: the same key is
+    needed by the existence check and by the download itself. The cache is
+    bounded, but large enough for every 1x1 degree tile on Earth (64,800).
+    """
+    base_name = format_tile_name(lat, lon)
+    return base_name + "/" + base_name + ".tif"
+
+def list_existing_files(directory):
+    """
+    Returns the names of the files already present in a directory.
+    A single directory scan replaces one stat() call per tile, which matters
+    for large selections and slow (e.g. network) drives.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+# --- Shared S3 client ---
+# botocore clients are thread-safe, and keeping a single one alive for the
+# whole session lets every download reuse its pool of keep-alive connections
+# instead of paying a new TCP/TLS handshake per tile and per batch.
+# boto3 itself is only imported here: it takes a few hundred milliseconds to
+# load, which would otherwise delay the application's startup.
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+def get_s3_client():
+    """Returns the process-wide anonymous S3 client, creating it on first use."""
+    global _s3_client
+    with _s3_client_lock:
+        if _s3_client is None:
+            import boto3
+            import botocore.client
+            config = botocore.client.Config(
+                signature_version=botocore.UNSIGNED,
+                max_pool_connections=MAX_POOL_CONNECTIONS,
+                tcp_keepalive=True,
+                connect_timeout=CONNECT_TIMEOUT,
+                read_timeout=READ_TIMEOUT,
+                # Adaptive mode backs off on throttling (503 SlowDown) and 5xx responses
+                retries={'max_attempts': 10, 'mode': 'adaptive'},
+            )
+            _s3_client = boto3.client('s3', config=config)
+        return _s3_client
+
+# --- Shared download pools ---
+# Downloads from every DownloadWorker run on the same pools, so their threads
+# are started once and then reused by later download batches. Byte ranges have
+# their own pool: a tile task waits for its parts, and must never wait for
+# work queued behind it on its own pool.
+_executors = {}
+_executors_lock = threading.Lock()
+
+def _get_executor(name, max_workers):
+    """Returns the process-wide thread pool with the given name, creating it on first use."""
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+            _executors[name] = executor
+        return executor
+
+def get_download_executor():
+    """Returns the process-wide thread pool used to download tiles."""
+    return _get_executor("tile-download", MAX_WORKERS)
+
+def get_part_executor():
+    """Returns the process-wide thread pool used to download the byte ranges of large tiles."""
+    return _get_executor("tile-part", MAX_PART_WORKERS)
+
+def _preallocate(f, size):
+    """
+    Gives a freshly created file its final size before it is written.
+    On POSIX systems the blocks are reserved up front, which avoids
+    fragmentation and lets byte-range parts land in place; elsewhere (or on
+    filesystems without support) the file is simply extended.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass
+    f.truncate(size)
+
+def _object_size(s3_object):
+    """
+    Returns the full size of an S3 object from a (possibly ranged) GET response.
+    For a range, Content-Length is the length of the range, and the object's
+    size is the part of Content-Range after the slash ("bytes 0-99/1234").
+    """
+    content_range = s3_object.get('ContentRange')
+    if content_range:
+        return int(content_range.rsplit('/', 1)[1])
+    return int(s3_object.get('ContentLength', 0))
+
+class DownloadCancelled(Exception):
+    """Raised from inside a transfer to abort it when the user stops the download."""
+
+
+class _ProgressReader:
+    """
+    A minimal file-like wrapper around a boto3 StreamingBody that reports the
+    size of every read to a callback. This lets shutil.copyfileobj drive the
+    copy while progress and cancellation are still handled per read.
+    """
+    def __init__(self, raw, callback, is_stopped):
+        self._raw = raw
+        self._callback = callback
+        self._is_stopped = is_stopped
+
+    def read(self, size=-1):
+        # Checked before reading, so a cancelled copy does not fetch another chunk
+        if self._is_stopped():
+            raise DownloadCancelled()
+        data = self._raw.read(size)
+        self._callback(len(data))
+        return data
+
+
+class _TileTransfer:
+    """
+    The state one tile's requests share: its first range and the parts
+    fetched alongside it. When any of them fails, the transfer is aborted so
+    that the others stop reading instead of finishing ranges that are about
+    to be thrown away.
+    """
+    def __init__(self):
+        self.aborted = threading.Event()
+        self.bytes_written = 0  # Guarded by the worker's lock
+        self.bodies = set()     # Guarded by the worker's lock
+
 
 class DownloadWorker(QThread):
     """
     A QThread worker for downloading Copernicus DEM tiles from AWS S3.
+    The thread only coordinates the batch; the tiles themselves are fetched
+    concurrently on the shared download pool.
     """
-    
-    file_progress = Signal(int, int)
-    total_progress_updated = Signal(int, int)
+
+    # Byte counts: 64-bit, as a large selection exceeds the range of an int
+    total_progress_updated = Signal('qint64', 'qint64')
     status_update = Signal(str)
     error_occurred = Signal(str)
     finished = Signal()
 
-    def __init__(self, tiles_to_download, save_path, overwrite_mode='overwrite'):
+    def __init__(self, tiles_to_download, save_path, overwrite_mode='overwrite', existing_files=None):
         """
         Args:
-            tiles_to_download (list): A list of (lat, lon) tuples.
+            tiles_to_download (sequence): The (lat, lon) tuples to download.
             save_path (str): The absolute path to the directory to save files in.
             overwrite_mode (str): Can be 'overwrite' or 'skip'.
+            existing_files (set): The file names already in save_path, if the
+                caller has listed them. Otherwise the directory is scanned
+                when skipping existing files.
         """
         super().__init__()
         self.tiles = tiles_to_download
         self.save_path = save_path
+        self.existing_files = existing_files
         self.s3_client = None
-        self._is_stopped = False
+        # Set by stop(); waited on by the retry backoff so a stop interrupts it
+        self._stop_event = threading.Event()
         self.overwrite_mode = overwrite_mode
 
+        # Shared between the pool threads, guarded by the lock
+        self._lock = threading.Lock()
+        self._cumulative_bytes_downloaded = 0
+        self._grand_total_size = 0
+        self._sized_count = 0
+        self._unavailable_count = 0
+        self._downloaded_count = 0  # Tiles fully written to disk
+        self._total_count = 0
+        # Names of the tiles the bucket has no object for (e.g. open ocean)
+        self._not_found = []
+        # Response bodies being read, so stop() can abort them mid-read
+        self._active_bodies = set()
+
     def run(self):
         """The main entry point for the thread's execution."""
+        pending = set()
         try:
-            self.s3_client = boto3.client('s3', config=botocore.client.Config(signature_version=botocore.UNSIGNED))
-            
-            # --- Pre-flight check to calculate total size ---
-            self.status_update.emit("Calculating total download size...")
-            grand_total_size = 0
-            tiles_to_actually_download = []
-
-            for lat, lon in self.tiles:
-                s3_key = format_tile_s3_key(lat, lon)
-                local_path = os.path.join(self.save_path, os.path.basename(s3_key))
-
-                if self.overwrite_mode == 'skip' and os.path.exists(local_path):
-                    self.status_update.emit(f"Skipping existing file: {os.path.basename(s3_key)}")
+            self.s3_client = get_s3_client()
+
+            # --- Work out which tiles actually need downloading ---
+            # Each job carries everything _download_one needs, so the S3 key,
+            # file name and local path are computed only once per tile.
+            jobs = []
+            path_prefix = os.path.join(self.save_path, "")  # joined once, with a trailing separator
+            existing_files = set()
+            if self.overwrite_mode == 'skip':
+                existing_files = self.existing_files if self.existing_files is not None else list_existing_files(self.save_path)
+
+            # Keys are always "<name>/<name>.tif": the file name is the part
+            # after the slash, no need for the more general os.path.basename
+            s3_keys = [format_tile_s3_key(lat, lon) for lat, lon in self.tiles]
+            file_names = [s3_key.rsplit('/', 1)[1] for s3_key in s3_keys]
+
+            for s3_key, file_name in zip(s3_keys, file_names):
+                if file_name in existing_files:
+                    logger.info(f"Skipping existing file: {file_name}")
                     continue
-                
-                tiles_to_actually_download.append((lat, lon))
-                try:
-                    response = self.s3_client.head_object(Bucket="copernicus-dem-30m", Key=s3_key)
-                    grand_total_size += int(response.get('ContentLength', 0))
-                except botocore.exceptions.ClientError:
-                    logger.warning(f"Tile not found on server (404): {s3_key}", exc_info=True)
-                    pass 
-
-                if self._is_stopped:
-                    self.status_update.emit("Download cancelled during size calculation.")
-                    #self.finished.emit()
-                    return
+
+                jobs.append((s3_key, file_name, path_prefix + file_name))
 
             # --- Main Download Loop ---
-            cumulative_bytes_downloaded = 0
-            total_tiles_to_process = len(tiles_to_actually_download)
-                        
-            for i, (lat, lon) in enumerate(tiles_to_actually_download):
-                if self._is_stopped:
-                    self.status_update.emit("Download cancelled by user.")
-                    break
-                
-                self.file_progress.emit(i + 1, total_tiles_to_process)
-                s3_key = format_tile_s3_key(lat, lon)
-                file_name = os.path.basename(s3_key)
-                local_path = os.path.join(self.save_path, file_name)
-
-                try:
-                    self.status_update.emit(f"Downloading: {file_name}...")
-                    s3_object = self.s3_client.get_object(Bucket="copernicus-dem-30m", Key=s3_key)
-                    streaming_body = s3_object['Body']
-                        
-                    with open(local_path, 'wb') as f:
-                        # Read and write in 1MB chunks
-                        for chunk in streaming_body.iter_chunks(chunk_size=1024 * 1024):
-                            
-                            if self._is_stopped:
-                                # Clean up the partially downloaded file
-                                f.close()
-                                streaming_body.close()
-                                os.remove(local_path)
-                                self.status_update.emit(f"Cancelled: {file_name}")
-                                break
-                                
-                            f.write(chunk)
-                            cumulative_bytes_downloaded += len(chunk)                          
-                            self.total_progress_updated.emit(cumulative_bytes_downloaded, grand_total_size)
-
-                        else:
-                            self.status_update.emit(f"Finished: {file_name}")
-                                
-                except botocore.exceptions.ClientError as e:
-                    error_code = e.response['Error']['Code']
-                    if error_code == "404":
-                        message = f"Tile not found on server: {file_name}"
-                        # A 404 is a known possibility, so a WARNING is appropriate.
-                        logger.warning(message)
-                        self.status_update.emit(f"Skipped (Not Found): {file_name}")
-                    else:
-                        message = f"Network/Boto3 Error for {file_name}: {e}"
-                        # Other client errors are more severe.
-                        logger.error(message, exc_info=True)
-                        self.error_occurred.emit(message)
+            # There is no size pre-flight: each tile's size is taken from the
+            # headers of its first GET response as the downloads start.
+            executor = get_download_executor()
+            self._total_count = len(jobs)
+            pending = {executor.submit(self._download_one, *job) for job in jobs}
+
+            # The pool threads only update counters; this thread reports
+            # progress at a fixed rate while it waits for them to finish.
+            while pending:
+                done, pending = wait(pending, timeout=PROGRESS_EMIT_INTERVAL)
+                if self._stop_event.is_set():
+                    # Tiles still queued on the shared pool are dropped
+                    # without ever starting; the pool itself stays up.
+                    for future in pending:
+                        future.cancel()
+                for future in done:
+                    if not future.cancelled():
+                        future.result()
+                with self._lock:
+                    bytes_downloaded = self._cumulative_bytes_downloaded
+                    total_size = self._estimated_total_size()
+                self.total_progress_updated.emit(bytes_downloaded, total_size)
+
+            if self._stop_event.is_set():
+                self.status_update.emit("Download cancelled by user.")
 
         except Exception as e:
             message = f"A critical error occurred in the download worker: {e}"
             logger.exception(message)
             self.error_occurred.emit(message)
         finally:
+            if pending:
+                # Left the loop early: stop the rest of the batch, and only
+                # report finished once no tile is writing any more
+                self.stop()
+                for future in pending:
+                    future.cancel()
+                wait(pending)
             self.finished.emit()
 
+    def progress_snapshot(self):
+        """
+        Thread-safe getter for the state of the running batch. Meant to be
+        polled from the GUI thread instead of receiving a signal per file.
+
+        Returns:
+            tuple: (tiles_downloaded, tiles_total, bytes_downloaded, tiles_not_found)
+        """
+        with self._lock:
+            return self._downloaded_count, self._total_count, self._cumulative_bytes_downloaded, len(self._not_found)
+
+    def not_found_tiles(self):
+        """Thread-safe getter for the names of the tiles not found on the server."""
+        with self._lock:
+            return list(self._not_found)
+
+    def _estimated_total_size(self):
+        """
+        Estimates the size of the whole batch while some tiles have not
+        reported their size yet, by extrapolating the average size of the
+        tiles seen so far. Must be called with the lock held.
+        """
+        if self._sized_count == 0:
+            return 0
+        expected_count = self._total_count - self._unavailable_count
+        estimate = self._grand_total_size * expected_count // self._sized_count
+        return max(estimate, self._cumulative_bytes_downloaded)
+
+    def _add_progress(self, transfer, num_bytes):
+        """Adds freshly written bytes to the shared counter and to the tile's own."""
+        with self._lock:
+            self._cumulative_bytes_downloaded += num_bytes
+            transfer.bytes_written += num_bytes
+
+    def _abort_transfer(self, transfer):
+        """Stops every request of a tile, closing the bodies being read."""
+        transfer.aborted.set()
+        with self._lock:
+            bodies = list(transfer.bodies)
+        for streaming_body in bodies:
+            streaming_body.close()
+
+    def _discard_transfer(self, transfer, total_size):
+        """Takes a failed tile's bytes and size back out of the batch's progress."""
+        with self._lock:
+            self._cumulative_bytes_downloaded -= transfer.bytes_written
+            self._grand_total_size -= total_size
+            self._sized_count -= 1
+
+    def _get_object(self, s3_key, byte_range):
+        """
+        Issues a ranged GET for a tile. Connection failures and timeouts are
+        retried GET_RETRIES times with an exponential backoff before giving up.
+        """
+        import botocore.exceptions
+        for attempt in range(GET_RETRIES + 1):
+            try:
+                return self.s3_client.get_object(Bucket=S3_BUCKET, Key=s3_key, Range=byte_range)
+            except (botocore.exceptions.EndpointConnectionError, botocore.exceptions.ReadTimeoutError) as e:
+                if attempt == GET_RETRIES or self._stop_event.is_set():
+                    raise
+                delay = GET_RETRY_BASE_DELAY * 2 ** attempt
+                logger.warning(f"GET {s3_key} failed ({e}), retrying in {delay:.1f}s")
+                if self._stop_event.wait(delay):
+                    raise DownloadCancelled() from None
+
+    def _copy_body(self, streaming_body, f, transfer):
+        """
+        Copies a response body into an open file, reporting progress as it goes.
+        Raises DownloadCancelled as soon as the user stops the download, or
+        the tile's transfer is aborted.
+        """
+        def is_cancelled():
+            return self._stop_event.is_set() or transfer.aborted.is_set()
+
+        reader = _ProgressReader(streaming_body, functools.partial(self._add_progress, transfer), is_cancelled)
+        with self._lock:
+            self._active_bodies.add(streaming_body)
+            transfer.bodies.add(streaming_body)
+        try:
+            shutil.copyfileobj(reader, f, COPY_BUFFER_SIZE)
+        except Exception:
+            # A read failing because its body was closed under it is a cancellation
+            if is_cancelled():
+                raise DownloadCancelled() from None
+            raise
+        finally:
+            with self._lock:
+                self._active_bodies.discard(streaming_body)
+                transfer.bodies.discard(streaming_body)
+
+    def _download_one(self, s3_key, file_name, local_path):
+        """
+        Downloads a single tile. Runs on one of the pool threads.
+
+        The first request asks for the first PART_SIZE bytes only. Its
+        Content-Range header reveals the tile's full size; if there is more,
+        the remaining ranges are fetched in parallel on the part pool and
+        written at their offsets while this thread writes the first part.
+
+        Args:
+            s3_key (str): The tile's key in the bucket.
+            file_name (str): The tile's file name, used in status messages.
+            local_path (str): Where to write the tile.
+        """
+        import botocore.exceptions
+        if self._stop_event.is_set():
+            return
+
+        total_size = None
+        try:
+            logger.debug(f"Downloading: {file_name}")
+            s3_object = self._get_object(s3_key, f"bytes=0-{PART_SIZE - 1}")
+            streaming_body = s3_object['Body']
+            total_size = _object_size(s3_object)
+
+            with self._lock:
+                self._grand_total_size += total_size
+                self._sized_count += 1
+
+            transfer = _TileTransfer()
+            part_futures = []
+            try:
+                with open(local_path, 'wb') as f:
+                    _preallocate(f, total_size)
+                    if total_size > PART_SIZE:
+                        part_executor = get_part_executor()
+                        part_futures = [
+                            part_executor.submit(self._download_part, s3_key, local_path, start, min(start + PART_SIZE, total_size) - 1, transfer)
+                            for start in range(PART_SIZE, total_size, PART_SIZE)
+                        ]
+                    self._copy_body(streaming_body, f, transfer)
+
+                for future in part_futures:
+                    future.result()
+            except BaseException as e:
+                # Clean up the partially downloaded file, once no part is writing to it
+                self._abort_transfer(transfer)
+                streaming_body.close()
+                wait(part_futures)
+                cancelled = isinstance(e, DownloadCancelled) and self._stop_event.is_set()
+                if not cancelled:
+                    # A failed tile is left out of the progress, like one
+                    # that never reported a size
+                    self._discard_transfer(transfer, total_size)
+                    total_size = None
+                if os.path.exists(local_path):
+                    os.remove(local_path)
+                if cancelled:
+                    logger.debug(f"Cancelled: {file_name}")
+                    return
+                if isinstance(e, DownloadCancelled):
+                    # Aborted because one of the parts failed: report its error
+                    for future in part_futures:
+                        error = future.exception()
+                        if error is not None and not isinstance(error, DownloadCancelled):
+                            raise error from None
+                raise
+
+            with self._lock:
+                self._downloaded_count += 1
+            logger.debug(f"Finished: {file_name}")
+
+        except DownloadCancelled:
+            # Stopped while waiting to retry the first request
+            logger.debug(f"Cancelled: {file_name}")
+
+        except botocore.exceptions.ClientError as e:
+            if total_size is None:
+                # The tile never reported a size; leave it out of the estimate
+                with self._lock:
+                    self._unavailable_count += 1
+
+            error_code = e.response['Error']['Code']
+            if error_code in ("404", "NoSuchKey"):
+                message = f"Tile not found on server: {file_name}"
+                # A 404 is a known possibility, so a WARNING is appropriate.
+                logger.warning(message)
+                with self._lock:
+                    self._not_found.append(file_name)
+            else:
+                message = f"Network/Boto3 Error for {file_name}: {e}"
+                # Other client errors are more severe.
+                logger.error(message, exc_info=True)
+                self.error_occurred.emit(message)
+
+        except botocore.exceptions.BotoCoreError as e:
+            # Connection problems that survived the retries: only this tile fails
+            with self._lock:
+                if total_size is None:
+                    self._unavailable_count += 1
+            message = f"Network/Boto3 Error for {file_name}: {e}"
+            logger.error(message, exc_info=True)
+            self.error_occurred.emit(message)
+
+        except OSError as e:
+            # A local file error (permissions, disk full...): only this tile fails
+            with self._lock:
+                if total_size is None:
+                    self._unavailable_count += 1
+            message = f"Could not download {file_name}: {e}"
+            logger.error(message, exc_info=True)
+            self.error_occurred.emit(message)
+
+    def _download_part(self, s3_key, local_path, start, end, transfer):
+        """
+        Downloads the byte range [start, end] of a tile into its place in the
+        local file. Runs on the part pool. A failure aborts the tile's other
+        requests.
+        """
+        if self._stop_event.is_set() or transfer.aborted.is_set():
+            raise DownloadCancelled()
+
+        try:
+            s3_object = self._get_object(s3_key, f"bytes={start}-{end}")
+            streaming_body = s3_object['Body']
+            try:
+                with open(local_path, 'r+b') as f:
+                    f.seek(start)
+                    self._copy_body(streaming_body, f, transfer)
+            finally:
+                streaming_body.close()
+        except DownloadCancelled:
+            raise
+        except BaseException:
+            self._abort_transfer(transfer)
+            raise
+
+    def is_stopped(self):
+        """Returns True once stop() has been called."""
+        return self._stop_event.is_set()
 
     def stop(self):
         """
-        Sets the stop flag to True. The running loop will check this flag
-        and exit gracefully.
+        Sets the stop event. The pool threads check it between reads and
+        exit gracefully, and tiles not started yet are cancelled. Bodies being
+        read are closed too, so an in-flight read is aborted instead of
+        draining its whole chunk.
         """
-        self._is_stopped = True        
\ No newline at end of file
+        self._stop_event.set()
+        with self._lock:
+            active_bodies = list(self._active_bodies)
+        for streaming_body in active_bodies:
+            streaming_body.close()
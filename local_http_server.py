@@ -1,27 +1,133 @@
 import os
+import socket
 import logging
 import functools
-from http.server import SimpleHTTPRequestHandler
-from socketserver import TCPServer
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from PySide6.QtCore import QThread, Signal
 
 logger = logging.getLogger(__name__)
 
-# --- NEW: Create a TCPServer subclass that allows address reuse ---
-class ReusableTCPServer(TCPServer):
+# Threads serving the map. Chromium opens at most 6 connections per host,
+# so a small fixed pool covers the burst of requests made by a page load.
+HTTP_WORKERS = 8
+
+# Seconds an idle keep-alive connection may hold a pool thread
+KEEP_ALIVE_TIMEOUT = 5
+
+# The vendored libraries (Leaflet) only change with an update of the app, so
+# the web view may reuse them for a day without asking. The map's own files
+# are always revalidated, which costs a 304 when they are unchanged.
+LIB_CACHE_CONTROL = "public, max-age=86400"
+APP_CACHE_CONTROL = "no-cache"
+
+# --- NEW: Create a server subclass that allows address reuse ---
+class ReusableTCPServer(ThreadingHTTPServer):
     """
-    A custom TCPServer that sets the allow_reuse_address flag.
+    A custom HTTP server that sets the allow_reuse_address flag.
     This prevents "Address already in use" errors on rapid restarts.
+    Connections are handled on a fixed pool of threads, so the web view can
+    fetch the page's scripts and stylesheets in parallel without a new
+    thread being started for each of them.
     """
     allow_reuse_address = True
 
+    def __init__(self, server_address, RequestHandlerClass):
+        super().__init__(server_address, RequestHandlerClass)
+        self._pool = ThreadPoolExecutor(max_workers=HTTP_WORKERS, thread_name_prefix="map-http")
+        # Open connections, so server_close() can end the kept-alive ones
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        """Hands the connection over to the pool instead of a new thread."""
+        with self._connections_lock:
+            self._connections.add(request)
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self):
+        """
+        Closes the server and ends its open connections. Unlike the daemon
+        threads of a plain ThreadingHTTPServer, the pool's threads are joined
+        at interpreter exit, and one waiting on a kept-alive connection would
+        hold up the exit until KEEP_ALIVE_TIMEOUT.
+        """
+        super().server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for request in connections:
+            try:
+                # Wakes up a handler blocked reading the next request
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+class MapRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the map's static files. The access log goes to the module logger
+    at DEBUG level instead of one unconditional stderr write per request.
+    HTTP/1.1 lets the web view reuse its connections between requests, and
+    ETag/Cache-Control headers let it answer reloads from its cache.
+    """
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+
+    def send_head(self):
+        """
+        Adds caching headers to file responses, and answers a request with
+        304 Not Modified when the client's ETag is still current. The ETag
+        is derived from the file's size and modification time, which
+        changes whenever the file does, without reading it.
+        """
+        self._cache_headers = None
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return super().send_head()
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        is_lib = self.path.lstrip("/").startswith("lib/")
+        self._cache_headers = (etag, LIB_CACHE_CONTROL if is_lib else APP_CACHE_CONTROL)
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+            self.send_response(304)
+            self.end_headers()
+            return None
+        return super().send_head()
+
+    def end_headers(self):
+        cache_headers = getattr(self, "_cache_headers", None)
+        if cache_headers:
+            etag, cache_control = cache_headers
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self._cache_headers = None
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
 class LocalHttpServer(QThread):
     """
     A QThread that runs a simple local HTTP server.
+    The map is served over HTTP rather than loaded from file:// because
+    OpenStreetMap's tile servers reject requests without a Referer header,
+    which Chromium never sends for file:// pages.
     """
     server_started = Signal(str, int)
 
-    def __init__(self, host="localhost", port=8001, serve_dir="."):
+    def __init__(self, host="127.0.0.1", port=8001, serve_dir="."):
         super().__init__()
         self.host = host
         self.port = port
@@ -31,7 +137,7 @@ class LocalHttpServer(QThread):
     def run(self):
         """The entry point for the thread."""
         
-        Handler = functools.partial(SimpleHTTPRequestHandler, directory=self.serve_dir)
+        Handler = functools.partial(MapRequestHandler, directory=self.serve_dir)
 
         try:
             # --- MODIFIED: Use our new ReusableTCPServer class ---
@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
 def setup_logging(debug=True):
@@ -27,7 +30,16 @@ def setup_logging(debug=True):
         )
         handler.setFormatter(formatter)
     
-        # Add the handler to the root logger
-        root_logger.addHandler(handler)
+        # The root logger only puts records on a queue; a listener thread
+        # owns the console handler. Logging from the download threads is then
+        # a cheap enqueue instead of a synchronous, lock-serialized write.
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        # Flush whatever is still queued when the application exits
+        atexit.register(listener.stop)
+
+        # Add the queue handler to the root logger
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     logging.info(f"Logging configured with level: {'DEBUG' if debug else 'INFO'}")
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
-from PySide6.QtCore import Qt, QUrl, QSize, Signal
-from PySide6.QtGui import QAction, QIcon
+import functools
+from typing import TYPE_CHECKING
+from PySide6.QtCore import Qt, QUrl, QSize, Signal, Slot, QStandardPaths, QStringListModel
+from PySide6.QtGui import QAction, QIcon, QFont
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -9,14 +11,49 @@ from PySide6.QtWidgets import (
     QLabel,
     QVBoxLayout,
     QHBoxLayout,
-    QListWidget, 
+    QListView,
+    QAbstractItemView,
     QPushButton,
     QProgressBar, 
     QMessageBox, 
-    QMenu
+    QMenu,
+    QApplication
 )
+# QtWebEngine must be loaded before the QApplication is created, which happens
+# before any window is built: these imports cannot be deferred to __init__.
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebChannel import QWebChannel
+
+if TYPE_CHECKING:
+    # Only used in annotations; the controller creates the channel
+    from PySide6.QtWebChannel import QWebChannel
+
+# The download progress bar counts in tenths of a percent rather than bytes:
+# QProgressBar only takes 32-bit ints, too small for the byte count of a large
+# selection, and finer steps would not be visible anyway.
+PROGRESS_STEPS = 1000
+
+@functools.lru_cache(maxsize=None)
+def _icon(base_dir, name):
+    """
+    Returns the icon for a file in the application's icons folder, loading
+    it from disk only the first time. The icon set is small and fixed, so
+    the cache needs no bound.
+    """
+    return QIcon(os.path.join(base_dir, "icons", name))
+
+@functools.lru_cache(maxsize=None)
+def _font(point_size, bold=False):
+    """
+    Returns the application font at the given size, built once and then
+    shared by every label that uses it. Built lazily rather than at import
+    time, because a QFont needs the QApplication to exist.
+    """
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
 
 class MainWindow(QMainWindow):
     """
@@ -37,19 +74,35 @@ class MainWindow(QMainWindow):
 
         self.setWindowTitle("Copernicus DEM Downloader")
 
+        # The names currently shown in the sidebar, row by row, so that
+        # update_tile_list can add and remove single rows
+        self._tile_names = []
+
+        # Whether the download button currently acts as a stop button
+        self._is_downloading = False
+
+        # The web channel last set on the map page
+        self._web_channel = None
+
+        # Whether the map page has finished loading, kept up to date from the
+        # view's load signals
+        self._map_ready = False
+
         # Load icons
-        self.download_icon = QIcon(os.path.join(self.base_dir, "icons", "download-cloud.png"))
-        self.stop_icon = QIcon(os.path.join(self.base_dir, "icons", "cross-circle.png"))
-        self.grid_icon = QIcon(os.path.join(self.base_dir, "icons", "grid.png"))
-        self.broom_icon = QIcon(os.path.join(self.base_dir, "icons", "broom.png"))
-        self.control_power_icon = QIcon(os.path.join(self.base_dir, "icons", "control-power.png"))
-        self.about_icon = QIcon(os.path.join(self.base_dir, "icons", "information.png"))
-        self.import_icon = QIcon(os.path.join(self.base_dir, "icons", "folder-open-document.png"))
-        self.export_icon = QIcon(os.path.join(self.base_dir, "icons", "disk.png"))
+        self.download_icon = _icon(self.base_dir, "download-cloud.png")
+        self.stop_icon = _icon(self.base_dir, "cross-circle.png")
+        self.grid_icon = _icon(self.base_dir, "grid.png")
+        self.broom_icon = _icon(self.base_dir, "broom.png")
+        self.control_power_icon = _icon(self.base_dir, "control-power.png")
+        self.about_icon = _icon(self.base_dir, "information.png")
+        self.import_icon = _icon(self.base_dir, "folder-open-document.png")
+        self.export_icon = _icon(self.base_dir, "disk.png")
 
         # --- Create Core Layout ---
         main_splitter = QSplitter(Qt.Horizontal)
-        self.map_view = QWebEngineView()
+        self.map_view = self._create_map_view()
+        self.map_view.loadStarted.connect(self._on_map_load_started)
+        self.map_view.loadFinished.connect(self._on_map_load_finished)
         self.sidebar_widget = self._create_sidebar()
 
         main_splitter.addWidget(self.map_view)
@@ -64,31 +117,65 @@ class MainWindow(QMainWindow):
         self._setup_statusbar()
 
 
+    def _create_map_view(self):
+        """
+        Creates the web view for the map, on a profile with a persistent disk
+        cache: the map's scripts and OpenStreetMap's tiles are then reused
+        across launches instead of being downloaded again every time.
+        Browser features the map does not use are turned off.
+        """
+        map_view = QWebEngineView()
+
+        # The profile must outlive the page, so it belongs to the application
+        profile = QWebEngineProfile("copernicus30m", QApplication.instance())
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        if cache_dir:
+            profile.setCachePath(cache_dir)
+        profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        profile.setHttpCacheMaximumSize(64 * 1024 * 1024)
+
+        page = QWebEnginePage(profile, map_view)
+        settings = page.settings()
+        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
+        settings.setAttribute(QWebEngineSettings.WebGLEnabled, False)  # Leaflet draws with SVG/canvas
+        settings.setAttribute(QWebEngineSettings.AutoLoadIconsForPage, False)
+        settings.setAttribute(QWebEngineSettings.PlaybackRequiresUserGesture, True)
+        map_view.setPage(page)
+        return map_view
+
     def _create_sidebar(self):
         """Creates the sidebar widget with all its UI elements."""
         container = QWidget()
         layout = QVBoxLayout(container)
         title_layout = QHBoxLayout()
         
+        # Fonts are set once the labels sit in their layout, so the size
+        # hint is invalidated a single time, with the final font
         title_label = QLabel("Selected Tiles")
-        font = title_label.font()
-        font.setPointSize(14)
-        font.setBold(True)
-        title_label.setFont(font)
+        title_layout.addWidget(title_label)
+        title_label.setFont(_font(14, bold=True))
 
         self.tile_count_label = QLabel("(0)")
-        count_font = self.tile_count_label.font()
-        count_font.setPointSize(12)
-        self.tile_count_label.setFont(count_font)
-
-        title_layout.addWidget(title_label)
         title_layout.addWidget(self.tile_count_label)
+        self.tile_count_label.setFont(_font(12))
+
         title_layout.addStretch() 
         
-        self.tile_list_widget = QListWidget()
-        self.tile_list_widget.setToolTip("List of DEM tiles selected on the map.")
-        self.tile_list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.tile_list_widget.customContextMenuRequested.connect(self._setup_context_menu)
+        # A plain string model behind a list view: no item object per tile,
+        # and the view only paints the rows that are on screen
+        self.tile_list_model = QStringListModel(self)
+        self.tile_list_view = QListView()
+        self.tile_list_view.setModel(self.tile_list_model)
+        self.tile_list_view.setToolTip("List of DEM tiles selected on the map.")
+        self.tile_list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # All rows are plain one-line names: let the view assume a constant
+        # row height, and lay out long lists in batches instead of all at once
+        self.tile_list_view.setUniformItemSizes(True)
+        self.tile_list_view.setLayoutMode(QListView.Batched)
+        self.tile_list_view.setBatchSize(256)
+        self.tile_list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tile_list_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tile_list_view.customContextMenuRequested.connect(self._setup_context_menu)
         
         self.download_button = QPushButton("Download Selected Tiles")
         self.download_button.setIcon(self.download_icon)
@@ -96,10 +183,11 @@ class MainWindow(QMainWindow):
         self.download_button.clicked.connect(self.on_download_button_clicked)
 
         self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
         self.progress_bar.hide() # Hidden until a download starts
 
         layout.addLayout(title_layout)
-        layout.addWidget(self.tile_list_widget)
+        layout.addWidget(self.tile_list_view)
         layout.addWidget(self.download_button)
         layout.addWidget(self.progress_bar)
         return container
@@ -108,14 +196,14 @@ class MainWindow(QMainWindow):
     def _setup_actions(self):
         """Creates the reusable QAction objects for the application."""
         #Exit
-        self.exit_action = QAction(QIcon(self.control_power_icon), "&Exit", self)
+        self.exit_action = QAction(self.control_power_icon, "&Exit", self)
         self.exit_action.triggered.connect(self.close) 
 
         # Toggle Grid
         self.toggle_grid_action = QAction(self.grid_icon, "Show/Hide &Grid", self)
         self.toggle_grid_action.setCheckable(True)
         self.toggle_grid_action.setChecked(True)
-        self.toggle_grid_action.toggled.connect(self.toggle_grid_visibility_requested)
+        self.toggle_grid_action.toggled.connect(self._on_grid_toggled)
 
         # Clear Selection
         self.clear_selection_action = QAction(self.broom_icon, "&Clear Selection", self)
@@ -124,7 +212,7 @@ class MainWindow(QMainWindow):
         self.clear_selection_action.triggered.connect(self.clear_selection_requested)
 
         # About
-        self.about_action = QAction(QIcon(self.about_icon), "&About", self)
+        self.about_action = QAction(self.about_icon, "&About", self)
         self.about_action.setStatusTip("Show application information")
         self.about_action.triggered.connect(self.about_requested)
 
@@ -139,6 +227,11 @@ class MainWindow(QMainWindow):
         self.import_action.triggered.connect(self.import_selection_requested)
 
 
+    @Slot(bool)
+    def _on_grid_toggled(self, checked):
+        """Forwards the grid action's new state to the controller."""
+        self.toggle_grid_visibility_requested.emit(checked)
+
     def _setup_menu(self):
         """Creates the main menu bar."""
         menu = self.menuBar()
@@ -191,10 +284,12 @@ class MainWindow(QMainWindow):
         context_menu = QMenu(self)
         context_menu.addAction(self.clear_selection_action)
         context_menu.addAction(self.export_action)
-        context_menu.exec(self.tile_list_widget.mapToGlobal(position))
+        context_menu.exec(self.tile_list_view.mapToGlobal(position))
 
     # --- Public Methods for the Controller ---
 
+    @Slot(str)
+    @Slot(str, int)
     def show_status_message(self, message: str, timeout: int = 5000):
         """
         Public method to display a message in the status bar.
@@ -206,15 +301,24 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(message, timeout)
 
     def set_map_url(self, url: QUrl):
-        """Public method for the controller to set the map's URL."""
+        """
+        Public method for the controller to set the map's URL. Setting the
+        URL already shown is ignored rather than reloading the page.
+        """
+        if url == self.map_view.url():
+            return
         self.map_view.setUrl(url)
 
-    def set_web_channel(self, channel: QWebChannel):
+    def set_web_channel(self, channel: "QWebChannel"):
         """
         Public method for the controller to provide the web communication channel.
         The View is responsible for setting it on its internal web page.
+        Setting the channel already in place does nothing.
         """
-        self.map_view.page().setWebChannel(channel)    
+        if channel is self._web_channel:
+            return
+        self._web_channel = channel
+        self.map_view.page().setWebChannel(channel)
 
     def closeEvent(self, event):
         """
@@ -229,52 +333,112 @@ class MainWindow(QMainWindow):
         Public method for the controller to check if the map page is loaded
         and ready to accept JavaScript commands.
         """
-        return not self.map_view.page().url().isEmpty()    
-    
-    def run_javascript(self, js_code: str):
-        """Public method to execute a string of JavaScript code in the web view."""
-        self.map_view.page().runJavaScript(js_code)
+        return self._map_ready
 
+    @Slot()
+    def _on_map_load_started(self):
+        """The page is being (re)loaded: it cannot take commands until it finishes."""
+        self._map_ready = False
+
+    @Slot(bool)
+    def _on_map_load_finished(self, ok):
+        """Marks the map as ready once its page has loaded successfully."""
+        self._map_ready = ok
+
+    @Slot(str, int, str)
     def update_coord_display(self, coords_text: str, zoom_level: int, tile_name: str):
         """Public method to update the coordinate and zoom labels in the status bar."""
         self.coord_label.setText(coords_text)
         self.zoom_label.setText(f"Zoom Level: {zoom_level}")    
         self.hover_tile_label.setText(f"Tile: {tile_name}")
 
+    @Slot(list)
     def update_tile_list(self, tile_name_list: list):
-        """Clears and repopulates the sidebar list with new tile names."""
-        self.tile_list_widget.clear()
-        self.tile_list_widget.addItems(tile_name_list)    
+        """
+        Updates the sidebar list to show the given tile names, in order.
+        Only the rows that changed are touched: selecting or deselecting one
+        tile inserts or removes a single row, whatever the list's size.
+        When most rows change (clearing, importing a selection), the model is
+        reset in one go instead, which is cheaper than row-by-row edits.
+        The names must keep a consistent order from one call to the next.
+        """
+        # Nothing changed (e.g. a toggle undone within the same refresh)
+        if tile_name_list == self._tile_names:
+            return
+
+        model = self.tile_list_model
+        old_names = self._tile_names
+        old_set = set(old_names)
+        new_set = set(tile_name_list)
+        kept_count = len(old_set & new_set)
+        changed_count = len(old_names) + len(tile_name_list) - 2 * kept_count
+
+        # Repaint once for the whole update, not once per row
+        self.tile_list_view.setUpdatesEnabled(False)
+        try:
+            if changed_count > kept_count:
+                model.setStringList(tile_name_list)
+            else:
+                # Remove the tiles that are no longer selected, bottom-up so
+                # that the rows still to visit keep their numbers
+                for row in range(len(old_names) - 1, -1, -1):
+                    if old_names[row] not in new_set:
+                        model.removeRows(row, 1)
+
+                # Insert the new tiles at their position; kept rows are already in order
+                for row, name in enumerate(tile_name_list):
+                    if name not in old_set:
+                        model.insertRows(row, 1)
+                        model.setData(model.index(row), name)
+        finally:
+            self.tile_list_view.setUpdatesEnabled(True)
+        self._tile_names = list(tile_name_list)
 
     def update_download_button_state(self, is_enabled: bool):
         """Enables or disables the download button."""
         self.download_button.setEnabled(is_enabled)    
 
+    @Slot()
     def on_download_button_clicked(self):
         """
         When the main action button is clicked, this determines whether to
         emit a 'download_requested' or 'stop_download_requested' signal
-        based on its current text/state.
+        based on the current download state.
         """
-        if "Stop" in self.download_button.text():
+        if self._is_downloading:
             self.stop_download_requested.emit()
         else:
-            self.download_requested.emit()    
+            self.download_requested.emit()
 
     def set_download_state(self, is_downloading: bool):
         """Configures the UI for either a downloading or an idle state."""
-        self.tile_list_widget.setEnabled(not is_downloading)
+        if is_downloading == self._is_downloading:
+            return # Already in that state (the window starts out idle)
+        self._is_downloading = is_downloading
+        self.tile_list_view.setEnabled(not is_downloading)
         if is_downloading:
             self.download_button.setText("Stop Download")
             self.download_button.setIcon(self.stop_icon)
             self.progress_bar.setValue(0)
-            self.progress_bar.setFormat("%p% - %v / %m Bytes")
+            # The bar's text would be re-laid out on every progress update;
+            # the status bar already reports what is being downloaded.
+            self.progress_bar.setTextVisible(False)
             self.progress_bar.show()
         else: # Reverting to idle state
             self.download_button.setText("Download Selected Tiles")
             self.download_button.setIcon(self.download_icon)
             self.progress_bar.hide()
-            self.progress_bar.setFormat("%p%")        
+            self.progress_bar.setTextVisible(True)
+
+    def set_progress(self, value: int, maximum: int):
+        """
+        Shows the download progress as value out of maximum (in bytes).
+        The bar is only touched when the displayed step actually changes, so
+        progress updates that would not move it cause no repaint.
+        """
+        step = min(value * PROGRESS_STEPS // maximum, PROGRESS_STEPS) if maximum > 0 else 0
+        if step != self.progress_bar.value():
+            self.progress_bar.setValue(step)
 
     def update_tile_count(self, count: int):
         """Updates the text of the tile count label in the sidebar."""
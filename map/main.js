@@ -60,6 +60,8 @@ function toggleGridVisibility(isVisible) {
  * @param {number} lon - The integer longitude of the tile's SW corner.
  */
 function addHighlight(lat, lon) {
+    const tileId = `${lat}_${lon}`;
+    if (highlightedTiles[tileId]) return; // Already highlighted
     if (!selectionLayer) {
         selectionLayer = L.layerGroup().addTo(map);
     }
@@ -69,7 +71,6 @@ function addHighlight(lat, lon) {
         interactive: false // The highlight itself shouldn't be clickable
     });
     
-    const tileId = `${lat}_${lon}`;
     highlightedTiles[tileId] = rect; // Store the layer
     selectionLayer.addLayer(rect);
 }
@@ -88,6 +89,22 @@ function removeHighlight(lat, lon) {
     }
 }
 
+/**
+ * Applies a batch of highlight changes in one call from Python.
+ * @param {Array<Array>} ops - An array of [lat, lon, action] entries,
+ *                             where action is 'add' or 'remove'.
+ */
+function applyHighlightBatch(ops) {
+    ops.forEach(op => {
+        const [lat, lon, action] = op;
+        if (action === 'add') {
+            addHighlight(lat, lon);
+        } else {
+            removeHighlight(lat, lon);
+        }
+    });
+}
+
 function clearAllHighlights() {
     if (selectionLayer) {
         selectionLayer.clearLayers();
@@ -144,13 +161,27 @@ document.addEventListener("DOMContentLoaded", () => {
         window.backend = channel.objects.backend;
 
         if (window.backend) {
-            // Mouse move for status bar
+            // Commands from Python arrive as signals carrying plain data
+            window.backend.grid_visibility_changed.connect(toggleGridVisibility);
+            window.backend.highlights_changed.connect(applyHighlightBatch);
+            window.backend.highlights_synced.connect(syncHighlights);
+
+            // Mouse move for status bar, sent at most once per animation
+            // frame: only the latest position crosses the web channel, as a
+            // single "lat,lng,zoom" string
+            let pendingMouseMove = null;
             map.on('mousemove', e => {
-                window.backend.on_mouse_move(e.latlng.lat, e.latlng.lng, map.getZoom());
+                if (pendingMouseMove === null) {
+                    requestAnimationFrame(() => {
+                        window.backend.on_mouse_move(`${pendingMouseMove.lat},${pendingMouseMove.lng},${map.getZoom()}`);
+                        pendingMouseMove = null;
+                    });
+                }
+                pendingMouseMove = e.latlng;
             });
             map.on('zoomend', () => {
                 const center = map.getCenter();
-                window.backend.on_mouse_move(center.lat, center.lng, map.getZoom());
+                window.backend.on_mouse_move(`${center.lat},${center.lng},${map.getZoom()}`);
             });
 
             // --- NEW: Map click for tile selection ---
@@ -0,0 +1,62 @@
+from PySide6.QtCore import QObject, Slot, Signal, QTimer
+
+class MapBridge(QObject):
+    """
+    A bridge object to facilitate communication from JavaScript to Python.
+    It exposes 'slots' that can be called from JS and emits 'signals'
+    that the main application can connect to.
+    """
+    coordinates_changed = Signal(float, float, int)
+    tile_clicked = Signal(int, int)
+
+    # Python -> JS commands. The page connects its functions to these signals,
+    # so each command travels as JSON data over the channel instead of as a
+    # new script that V8 has to parse. Going through one channel also keeps
+    # the commands in order.
+    grid_visibility_changed = Signal(bool)
+    highlights_changed = Signal(list)   # [[lat, lon, 'add'|'remove'], ...]
+    highlights_synced = Signal(list)    # [[lat, lon], ...], replaces all highlights
+
+    # Mouse moves are forwarded at most ~30 times per second
+    MOUSE_MOVE_INTERVAL_MS = 33
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Latest position received from JS, emitted when the timer fires
+        self._pending_position = None
+        self._mouse_move_timer = QTimer(self)
+        self._mouse_move_timer.setSingleShot(True)
+        self._mouse_move_timer.setInterval(self.MOUSE_MOVE_INTERVAL_MS)
+        self._mouse_move_timer.timeout.connect(self._emit_latest_position)
+
+    @Slot(str)
+    def on_mouse_move(self, payload):
+        """
+        A slot that is called from JavaScript whenever the mouse moves over the map.
+        Positions are coalesced: only the latest one is emitted, at most once
+        every MOUSE_MOVE_INTERVAL_MS, so the status bar is not reformatted and
+        repainted for every pixel of movement, yet always ends up on the
+        position where the mouse stopped.
+
+        The position arrives as one "lat,lng,zoom" string rather than three
+        typed arguments, and is only parsed when it is actually emitted.
+        
+        Args:
+            payload (str): Latitude and longitude of the mouse cursor and the
+                current zoom level of the map, separated by commas.
+        """
+        self._pending_position = payload
+        if not self._mouse_move_timer.isActive():
+            self._mouse_move_timer.start()
+
+    def _emit_latest_position(self):
+        """Emits the most recent mouse position received since the last emit."""
+        if self._pending_position is not None:
+            lat, lng, zoom = self._pending_position.split(",")
+            self._pending_position = None
+            self.coordinates_changed.emit(float(lat), float(lng), int(zoom))
+        
+    # --- Slot that receives the raw tile click from JS ---
+    @Slot(int, int)
+    def on_tile_clicked(self, lat, lon):
+        self.tile_clicked.emit(lat, lon)
@@ -1,5 +1,23 @@
 from PySide6.QtCore import QObject, Signal
 
+# --- Packed tile keys ---
+# Tiles are stored as a single int instead of a (lat, lon) tuple: hashing and
+# comparing an int is cheaper, and the set holds no tuple objects. Sorting the
+# keys orders the tiles by latitude, then longitude. The longitude gets a wide
+# field because the map can be panned past the antimeridian (e.g. lon 200).
+_LON_OFFSET = 32768
+_LAT_STRIDE = 2 * _LON_OFFSET
+
+def encode_tile(lat, lon):
+    """Packs a tile's integer (lat, lon) into a single int key."""
+    return (lat + 90) * _LAT_STRIDE + lon + _LON_OFFSET
+
+def decode_tile(key):
+    """Unpacks an int key made by encode_tile back into a (lat, lon) tuple."""
+    lat_part, lon_part = divmod(key, _LAT_STRIDE)
+    return lat_part - 90, lon_part - _LON_OFFSET
+
+
 class SelectionModel(QObject):
     """
     Manages the application's data state, specifically the set of selected tiles.
@@ -7,14 +25,23 @@ class SelectionModel(QObject):
     This class is completely independent of the UI.
     """
     # Signal that will be emitted with the new, complete set of selected tiles whenever a change occurs.
-    selection_changed = Signal(set)
+    # The frozenset holds packed keys (see encode_tile). Being immutable, the
+    # same object can be handed to every receiver without a defensive copy.
+    selection_changed = Signal(frozenset)
+    # Emitted just before selection_changed with what the change did, as two
+    # frozensets of packed keys: (added, removed). Listeners that only mirror
+    # the selection can update incrementally instead of diffing.
+    selection_delta = Signal(frozenset, frozenset)
 
     def __init__(self):
         super().__init__()
         # Use a private variable to store the state.
         # A set is used because it's efficient for adding, removing, and
         # checking for existence, and it automatically handles duplicates.
+        # It holds packed int keys rather than (lat, lon) tuples.
         self._selected_tiles = set()
+        # The frozenset last emitted with selection_changed
+        self._emitted_tiles = frozenset()
 
     def toggle_selection(self, tile):
         """
@@ -29,15 +56,16 @@ class SelectionModel(QObject):
             tile (tuple): A tuple of (integer_latitude, integer_longitude)
                           representing the tile.
         """
-        if tile in self._selected_tiles:
-            self._selected_tiles.remove(tile)
+        key = encode_tile(*tile)
+        if key in self._selected_tiles:
+            self._selected_tiles.remove(key)
+            self.selection_delta.emit(frozenset(), frozenset((key,)))
         else:
-            self._selected_tiles.add(tile)
+            self._selected_tiles.add(key)
+            self.selection_delta.emit(frozenset((key,)), frozenset())
         
         # Announce to the application that the selection has changed.
-        # We emit a copy of the set to ensure the original cannot be
-        # modified from outside this class.
-        self.selection_changed.emit(self._selected_tiles.copy())
+        self._emit_selection_changed()
 
     def get_selected_tiles(self):
         """
@@ -45,9 +73,21 @@ class SelectionModel(QObject):
         (like the controller) to query the current state.
 
         Returns:
-            set: A copy of the set of currently selected tiles.
+            frozenset: The currently selected (lat, lon) tuples.
+        """
+        return frozenset(map(decode_tile, self._selected_tiles))
+
+    def snapshot(self):
+        """
+        Returns an immutable snapshot of the selection, suitable for handing
+        over to long-running work such as a download. The tiles are sorted
+        (latitude first), so downloads run in a deterministic order and
+        neighbouring tiles are requested close together.
+
+        Returns:
+            tuple: The currently selected (lat, lon) tuples, sorted.
         """
-        return self._selected_tiles.copy()
+        return tuple(map(decode_tile, sorted(self._selected_tiles)))
 
     def has_selection(self):
         """
@@ -65,11 +105,29 @@ class SelectionModel(QObject):
         Args:
             tiles (set): The new set of (lat, lon) tuples for the selection.
         """
-        if self._selected_tiles != tiles:
-            self._selected_tiles = tiles
-            self.selection_changed.emit(self._selected_tiles.copy())
+        keys = {encode_tile(*tile) for tile in tiles}
+        if self._selected_tiles != keys:
+            added = keys - self._selected_tiles
+            removed = self._selected_tiles - keys
+            self._selected_tiles = keys
+            self.selection_delta.emit(frozenset(added), frozenset(removed))
+            self._emit_selection_changed()
 
     def clear_selection(self):
         """Resets the selection to an empty set."""
+        if not self._selected_tiles:
+            # Nothing to clear: announce the (empty) selection already emitted
+            self.selection_changed.emit(self._emitted_tiles)
+            return
+        removed = frozenset(self._selected_tiles)
         self._selected_tiles.clear()
-        self.selection_changed.emit(self._selected_tiles.copy())
\ No newline at end of file
+        self.selection_delta.emit(frozenset(), removed)
+        self._emit_selection_changed()
+
+    def _emit_selection_changed(self):
+        """
+        Emits the current selection as a frozenset. It is built once per change
+        and shared by all receivers, which cannot modify the model through it.
+        """
+        self._emitted_tiles = frozenset(self._selected_tiles)
+        self.selection_changed.emit(self._emitted_tiles)
\ No newline at end of file